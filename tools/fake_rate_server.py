@@ -0,0 +1,188 @@
+"""Local stand-in for the exchangerate-api.com v6 "latest" endpoint.
+
+Serves GET /v6/<key>/latest/<base> with a configurable amount of latency,
+HTTP errors, malformed JSON and payload size, so the currency refresh path
+can be exercised offline. Point the app at it with:
+
+    CURRENCY_API_BASE_URL=http://127.0.0.1:8765/v6/ python unit-convert.py
+"""
+import argparse
+import itertools
+import json
+import random
+import re
+import string
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+LATEST_PATH = re.compile(r"^/v6/(?P<key>[^/]+)/latest/(?P<base>[A-Za-z]{3})/?$")
+
+# A handful of real codes first so the app's menus look familiar
+KNOWN_CODES = ["USD", "EUR", "GBP", "JPY", "CAD", "AUD", "CHF", "CNY", "INR", "MXN"]
+
+
+def make_rates(count, base="USD", seed=0):
+    # Deterministic rates for `count` currency codes, quoted against `base`
+    rng = random.Random(seed)
+    codes = KNOWN_CODES[:count]
+    seen = set(codes)
+    # Made-up codes XAA..XZZ, then XAAA..XZZZ and so on, so any count works
+    length = 2
+    while len(codes) < count:
+        for letters in itertools.product(string.ascii_uppercase, repeat=length):
+            code = "X" + "".join(letters)
+            if code not in seen:
+                seen.add(code)
+                codes.append(code)
+                if len(codes) == count:
+                    break
+        length += 1
+    rates = {code: round(rng.uniform(0.05, 150.0), 4) for code in codes}
+    rates[base.upper()] = 1
+    return rates
+
+
+class FakeRateConfig:
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, malformed_rate=0.0,
+                 currencies=160, drift=0.0, valid_keys=None, seed=None):
+        self.latency = latency  # seconds added to every response
+        self.jitter = jitter  # extra random seconds on top of latency
+        self.error_rate = error_rate  # fraction of requests answered with HTTP 500/503
+        self.malformed_rate = malformed_rate  # fraction answered with broken JSON
+        self.currencies = currencies  # number of codes in conversion_rates
+        self.drift = drift  # max relative change applied to each rate per request
+        self.valid_keys = valid_keys  # None accepts any key
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.rates = make_rates(currencies, seed=seed or 0)
+
+
+class FakeRateHandler(BaseHTTPRequestHandler):
+    server_version = "FakeRateServer/1.0"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        config = self.server.config
+        with config.lock:
+            config.requests += 1
+            delay = config.latency + config.rng.uniform(0, config.jitter)
+            roll_error = config.rng.random() < config.error_rate
+            roll_malformed = config.rng.random() < config.malformed_rate
+            if config.drift:
+                for code in config.rates:
+                    config.rates[code] = round(
+                        config.rates[code] * (1 + config.rng.uniform(-config.drift, config.drift)), 6)
+            rates = dict(config.rates)
+
+        if delay:
+            time.sleep(delay)
+
+        match = LATEST_PATH.match(self.path)
+        if not match:
+            return self._send_json(404, {"result": "error", "error-type": "unsupported-code"})
+        if config.valid_keys is not None and match.group("key") not in config.valid_keys:
+            return self._send_json(403, {"result": "error", "error-type": "invalid-key"})
+        if roll_error:
+            status = 500 if config.rng.random() < 0.5 else 503
+            return self._send_body(status, b"Internal Server Error", "text/plain")
+        if roll_malformed:
+            return self._send_body(200, b'{"result": "success", "conversion_rates": {"USD": 1,', "application/json")
+
+        base = match.group("base").upper()
+        if base not in rates:
+            return self._send_json(404, {"result": "error", "error-type": "unsupported-code"})
+        base_rate = rates[base]
+        now = int(time.time())
+        self._send_json(200, {
+            "result": "success",
+            "documentation": "https://www.exchangerate-api.com/docs",
+            "terms_of_use": "https://www.exchangerate-api.com/terms",
+            "time_last_update_unix": now,
+            "time_next_update_unix": now + 3600,
+            "base_code": base,
+            "conversion_rates": {code: rate / base_rate for code, rate in rates.items()},
+        })
+
+    def _send_json(self, status, payload):
+        self._send_body(status, json.dumps(payload).encode(), "application/json")
+
+    def _send_body(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Client gave up (e.g. timed out) before we answered
+
+
+class FakeRateServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, config=None, host="127.0.0.1", port=0, verbose=False):
+        self.config = config or FakeRateConfig()
+        self.verbose = verbose
+        super().__init__((host, port), FakeRateHandler)
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v6/"
+
+    def start(self):
+        # Serve from a background thread; used by the load driver
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def add_config_arguments(parser):
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds of delay per response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random delay, up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of HTTP 500/503 responses")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="Fraction of truncated JSON responses")
+    parser.add_argument("--currencies", type=int, default=160, help="Number of currency codes per payload")
+    parser.add_argument("--drift", type=float, default=0.0, help="Max relative rate change per request")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducible runs")
+
+
+def config_from_args(args):
+    return FakeRateConfig(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                          malformed_rate=args.malformed_rate, currencies=args.currencies,
+                          drift=args.drift, seed=args.seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake exchangerate-api.com server for offline testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--key", action="append", dest="keys",
+                        help="Accept only this API key (repeatable); any key is accepted by default")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    config = config_from_args(args)
+    config.valid_keys = set(args.keys) if args.keys else None
+    server = FakeRateServer(config, args.host, args.port, verbose=args.verbose)
+    print(f"Serving fake exchange rates at {server.base_url}<key>/latest/<base>")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
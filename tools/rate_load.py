@@ -0,0 +1,219 @@
+"""Load and fault-injection driver for the currency rate pipeline.
+
+Runs the app's fetch and conversion code against the fake rate server
+(started in-process unless --url is given) and reports:
+
+  * refresh latency and failures by type
+  * currency conversion throughput, idle vs. while refreshes are running
+  * thread count and memory growth across repeated refreshes
+
+Example:
+
+    python tools/rate_load.py --latency 0.2 --jitter 0.5 --error-rate 0.1 --malformed-rate 0.05
+"""
+import argparse
+import importlib.util
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+
+from fake_rate_server import FakeRateServer, add_config_arguments, config_from_args
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "unit-convert.py")
+
+
+def load_app_module():
+    # The app file name has a dash in it, so it can't be imported normally
+    spec = importlib.util.spec_from_file_location("unit_convert", APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def format_bytes(size):
+    for unit in ("B", "KB", "MB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+class RateLoadDriver:
+    def __init__(self, app, base_url, api_key, timeout):
+        self.app = app
+        self.base_url = base_url
+        self.api_key = api_key
+        self.timeout = timeout
+        self.errors = Counter()
+
+    def refresh(self):
+        # Same work as the app's fetch_rates thread, minus the Tk callbacks
+        try:
+            rates = self.app.fetch_exchange_rates(self.api_key, base_url=self.base_url, timeout=self.timeout)
+        except Exception as e:
+            self.errors[type(e).__name__] += 1
+            return False
+        self.app.conversion_data['currency'] = rates
+        return True
+
+    def measure_latency(self, count):
+        latencies = []
+        ok = 0
+        for _ in range(count):
+            start = time.perf_counter()
+            ok += self.refresh()
+            latencies.append(time.perf_counter() - start)
+        return {
+            'requests': count,
+            'ok': ok,
+            'min': min(latencies),
+            'median': statistics.median(latencies),
+            'p95': percentile(latencies, 95),
+            'max': max(latencies),
+        }
+
+    def _convert_for(self, duration, rng):
+        conversions = 0
+        missing = 0
+        deadline = time.perf_counter() + duration
+        while time.perf_counter() < deadline:
+            codes = list(self.app.conversion_data['currency'])
+            for _ in range(1000):
+                try:
+                    self.app.convert_currency(rng.uniform(1, 1000), rng.choice(codes), rng.choice(codes),
+                                              self.app.conversion_data['currency'])
+                except KeyError:
+                    missing += 1  # The code vanished in a refresh between lookups
+                conversions += 1
+        return conversions, missing
+
+    def measure_throughput(self, duration, seed=0):
+        if not self.app.conversion_data['currency'] and not self.refresh():
+            return None  # Nothing to convert with
+        rng = random.Random(seed)
+
+        idle, _ = self._convert_for(duration, rng)
+
+        stop = threading.Event()
+        refreshes = Counter()
+
+        def refresh_loop():
+            while not stop.is_set():
+                refreshes[self.refresh()] += 1
+
+        worker = threading.Thread(target=refresh_loop, daemon=True)
+        worker.start()
+        busy, missing = self._convert_for(duration, rng)
+        stop.set()
+        worker.join(self.timeout + 1)
+
+        return {
+            'idle_per_sec': idle / duration,
+            'busy_per_sec': busy / duration,
+            'refreshes': refreshes[True] + refreshes[False],
+            'missing_codes': missing,
+        }
+
+    def measure_growth(self, count, interval):
+        # One short-lived daemon thread per refresh, as update_currency_rates does
+        tracemalloc.start()
+        start_threads = threading.active_count()
+        start_memory, _ = tracemalloc.get_traced_memory()
+        peak_threads = start_threads
+        threads = []
+        for _ in range(count):
+            thread = threading.Thread(target=self.refresh, daemon=True)
+            thread.start()
+            threads.append(thread)
+            peak_threads = max(peak_threads, threading.active_count())
+            time.sleep(interval)
+        for thread in threads:
+            thread.join(self.timeout + 1)
+        end_memory, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return {
+            'refreshes': count,
+            'start_threads': start_threads,
+            'peak_threads': peak_threads,
+            'end_threads': threading.active_count(),
+            'memory_growth': end_memory - start_memory,
+            'peak_memory': peak_memory - start_memory,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stress the currency rate pipeline against a fake server")
+    parser.add_argument("--url", help="Base URL of an already running server (e.g. http://127.0.0.1:8765/v6/)")
+    parser.add_argument("--key", default="test-key", help="API key to send")
+    parser.add_argument("--timeout", type=float, default=5.0, help="Request timeout in seconds")
+    parser.add_argument("--requests", type=int, default=50, help="Sequential refreshes for the latency run")
+    parser.add_argument("--duration", type=float, default=3.0, help="Seconds per throughput run")
+    parser.add_argument("--soak", type=int, default=200, help="Refreshes for the thread/memory run")
+    parser.add_argument("--interval", type=float, default=0.01, help="Seconds between soak refreshes")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.url
+    if not base_url:
+        server = FakeRateServer(config_from_args(args))
+        server.start()
+        base_url = server.base_url
+
+    try:
+        app = load_app_module()
+    except ImportError as e:
+        sys.exit(f"Could not load unit-convert.py ({e}); install requirements.txt first")
+    driver = RateLoadDriver(app, base_url, args.key, args.timeout)
+
+    try:
+        print(f"Target: {base_url}")
+
+        latency = driver.measure_latency(args.requests)
+        print("\nRefresh latency")
+        print(f"  ok {latency['ok']}/{latency['requests']}")
+        print(f"  min {latency['min'] * 1000:.1f} ms  median {latency['median'] * 1000:.1f} ms  "
+              f"p95 {latency['p95'] * 1000:.1f} ms  max {latency['max'] * 1000:.1f} ms")
+
+        throughput = driver.measure_throughput(args.duration, seed=args.seed or 0)
+        print("\nConversion throughput")
+        if throughput is None:
+            print("  skipped: no rates could be fetched")
+        else:
+            print(f"  idle            {throughput['idle_per_sec']:,.0f} conversions/s")
+            print(f"  during refresh  {throughput['busy_per_sec']:,.0f} conversions/s "
+                  f"({throughput['refreshes']} refreshes)")
+            print(f"  missing codes   {throughput['missing_codes']}")
+
+        growth = driver.measure_growth(args.soak, args.interval)
+        print("\nRepeated refreshes")
+        print(f"  threads  start {growth['start_threads']}  peak {growth['peak_threads']}  "
+              f"end {growth['end_threads']}")
+        print(f"  memory   growth {format_bytes(growth['memory_growth'])}  "
+              f"peak {format_bytes(growth['peak_memory'])}")
+
+        print("\nFailures by type")
+        if not driver.errors:
+            print("  none")
+        for name, count in driver.errors.most_common():
+            print(f"  {name}: {count}")
+    finally:
+        if server:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
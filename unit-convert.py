@@ -5,6 +5,7 @@ from tkinter import messagebox
 import urllib.request
 import urllib.error
 import json
+import re
 import threading
 import os
 from datetime import datetime
@@ -13,7 +14,9 @@ import pytz
 # Remove the hardcoded API key
 API_KEY = None
 API_KEY_FILE = "api_key.json"
-CURRENCY_API_BASE_URL = "https://v6.exchangerate-api.com/v6/"
+# Can be pointed at a local stand-in server (see tools/fake_rate_server.py)
+CURRENCY_API_BASE_URL = os.environ.get("CURRENCY_API_BASE_URL", "https://v6.exchangerate-api.com/v6/")
+CURRENCY_API_TIMEOUT = 10  # seconds
 
 def load_api_key():
     try:
@@ -66,6 +69,18 @@ def prompt_api_key():
     ttk.Button(button_frame, text="Save", command=save_and_close).pack(side=tk.LEFT, padx=10)
     ttk.Button(button_frame, text="Skip for now", command=skip).pack(side=tk.LEFT)
 
+def fetch_exchange_rates(api_key, base_currency="USD", base_url=None, timeout=None):
+    # Raw fetch without any dialogs; raises on network, HTTP or payload errors
+    url = f"{base_url or CURRENCY_API_BASE_URL}{api_key}/latest/{base_currency}"
+    with urllib.request.urlopen(url, timeout=timeout or CURRENCY_API_TIMEOUT) as response:
+        if response.getcode() != 200:
+            raise urllib.error.HTTPError(url, response.getcode(), "Failed to fetch exchange rates", None, None)
+        data = json.loads(response.read().decode())
+    if not isinstance(data, dict) or data.get('result', 'success') != 'success':
+        error_type = data.get('error-type', 'unknown') if isinstance(data, dict) else 'unknown'
+        raise ValueError(f"Exchange rate service returned an error: {error_type}")
+    return data['conversion_rates']
+
 # Function to fetch exchange rates
 def get_exchange_rates():
     global API_KEY
@@ -80,15 +95,9 @@ def get_exchange_rates():
             if result:
                 prompt_api_key()
             return None
-            
-        url = f"{CURRENCY_API_BASE_URL}{API_KEY}/latest/USD"
-        with urllib.request.urlopen(url) as response:
-            if response.getcode() == 200:
-                data = json.loads(response.read().decode())
-                return data['conversion_rates']
-            else:
-                raise urllib.error.HTTPError(url, response.getcode(), "Failed to fetch exchange rates", None, None)
-    except urllib.error.URLError as e:
+
+        return fetch_exchange_rates(API_KEY)
+    except (urllib.error.URLError, TimeoutError) as e:
         messagebox.showerror("Network Error", f"Unable to connect to exchange rate service:\n{str(e)}")
         return None
     except json.JSONDecodeError as e:
@@ -98,6 +107,78 @@ def get_exchange_rates():
         messagebox.showerror("Error", f"Error fetching exchange rates:\n{str(e)}")
         return None
 
+def convert_currency(value, from_unit, to_unit, rates):
+    # Rates are quoted against USD, so go through USD
+    if rates[from_unit] == 0:
+        raise ValueError("Invalid exchange rate")
+    usd_value = value / rates[from_unit]
+    return usd_value * rates[to_unit]
+
+def diff_rates(old_rates, new_rates):
+    # Which codes were added, removed or changed between two rate snapshots
+    added = {code: rate for code, rate in new_rates.items() if code not in old_rates}
+    removed = {code: rate for code, rate in old_rates.items() if code not in new_rates}
+    changed = {}
+    for code, rate in new_rates.items():
+        previous = old_rates.get(code)
+        if previous is None or previous == rate:
+            continue
+        changed[code] = {
+            'old': previous,
+            'new': rate,
+            'delta': rate - previous,
+            'change': abs(rate - previous) / abs(previous) if previous else float('inf')
+        }
+    return {'added': added, 'removed': removed, 'changed': changed}
+
+def filter_rate_diff(diff, threshold):
+    # Drop changes smaller than `threshold` (relative, e.g. 0.001 = 0.1%)
+    changed = {code: c for code, c in diff['changed'].items() if c['change'] >= threshold}
+    return {'added': diff['added'], 'removed': diff['removed'], 'changed': changed}
+
+def affected_currencies(diff):
+    # Rates are quoted against USD, so any pair touching one of these codes is stale
+    return set(diff['added']) | set(diff['removed']) | set(diff['changed'])
+
+def convert_temperature(value, from_unit, to_unit):
+    # First convert to Celsius
+    if from_unit == 'fahrenheit':
+        celsius = (value - 32) * 5/9
+    elif from_unit == 'kelvin':
+        celsius = value - 273.15
+    else:  # celsius
+        celsius = value
+
+    # Then convert to target unit
+    if to_unit == 'fahrenheit':
+        return (celsius * 9/5) + 32
+    elif to_unit == 'kelvin':
+        return celsius + 273.15
+    return celsius  # celsius to celsius
+
+def convert_value(value, unit_type, from_unit, to_unit, conversions):
+    # Plain conversion with no Tk access, safe to call from worker threads
+    if unit_type == 'currency':
+        return convert_currency(value, from_unit, to_unit, conversions)
+    if unit_type == 'temperature':
+        return convert_temperature(value, from_unit, to_unit)
+    return (value * conversions[to_unit]) / conversions[from_unit]
+
+# Pasted lists (spreadsheet columns/rows) are split on whitespace or semicolons
+BATCH_SEPARATORS = re.compile(r"[\s;]+")
+BATCH_CHUNK_SIZE = 500
+# Spreadsheets copy thousands separators along with the value (e.g. 1,234.50)
+THOUSANDS_GROUPED = re.compile(r"^[+-]?\d{1,3}(,\d{3})+(\.\d+)?$")
+
+def parse_input_value(token):
+    # Any other comma (decimal comma, comma-separated list) is ambiguous, so
+    # reject it rather than guess a different number
+    if ',' in token:
+        if not THOUSANDS_GROUPED.match(token):
+            raise ValueError(f"Ambiguous value: {token}")
+        token = token.replace(',', '')
+    return float(token)
+
 # Conversion data
 conversion_data = {
     'currency': {},  # Will be populated with real-time exchange rates
@@ -226,6 +307,12 @@ class UnitConverterApp:
         self.conversion_cache = {}
         self.last_currency_update = None
         self.update_interval = 3600  # 1 hour in seconds
+
+        # Rate change feed; caches first so the view never reads a stale result
+        self._rate_subscribers = []
+        self.subscribe_rate_changes(self._invalidate_currency_caches)
+        self.subscribe_rate_changes(self._refresh_currency_view)
+
         style = Style(theme='flatly')
         self.root.title("Unit Converter")
         self.root.geometry('600x500')
@@ -324,19 +411,47 @@ class UnitConverterApp:
                                    wraplength=300)  # Allow text wrapping
         self.result_label.grid(row=4, columnspan=3, **self.padding)
 
+        # Results list for pasted multi-value input, hidden until used
+        self.batch_frame = ttk.Frame(self.main_frame)
+        self.batch_frame.columnconfigure(0, weight=1)
+        self.batch_text = tk.Text(self.batch_frame, height=6, font=('Arial', 10),
+                                  state='disabled', wrap='none')
+        self.batch_text.grid(row=0, column=0, sticky='nsew')
+        batch_scrollbar = ttk.Scrollbar(self.batch_frame, orient='vertical',
+                                        command=self.batch_text.yview)
+        batch_scrollbar.grid(row=0, column=1, sticky='ns')
+        self.batch_text.configure(yscrollcommand=batch_scrollbar.set)
+        self.copy_results_button = ttk.Button(self.batch_frame, text="Copy Results",
+                                              command=self._copy_batch_results,
+                                              style='secondary.TButton')
+        self.copy_results_button.grid(row=0, column=2, padx=(10, 0), sticky='n')
+        self.batch_frame.grid(row=5, columnspan=3, sticky='nsew', padx=15)
+        self.batch_frame.grid_remove()
+
+        # Background batch conversion state
+        self._batch_job_id = 0
+        self._batch_job_key = None
+        self._batch_done_key = None  # Key of the last finished batch
+        self._batch_cancel_event = None
+
         # Add keyboard binding for Enter key
         self.input_entry.bind('<Return>', lambda event: self.convert())
+        self.input_entry.bind('<<Paste>>', self._on_paste)
 
         # Status bar
         self.status_bar = tk.Label(self.main_frame, text="Ready",
                                  bd=1, relief=tk.SUNKEN, anchor=tk.W,
                                  bg='#e0e0e0', font=('Arial', 8))
-        self.status_bar.grid(row=5, columnspan=3, sticky='ew', **self.padding)
+        self.status_bar.grid(row=6, columnspan=3, sticky='ew', **self.padding)
 
         # Initialize unit menus
         self.unit_type_var.trace('w', self.update_unit_menus)
         self.update_unit_menus()  # Call explicitly to initialize menus
 
+        # Any change of category or units makes a batch job or list stale
+        for var in (self.unit_type_var, self.from_unit_var, self.to_unit_var):
+            var.trace('w', self._on_batch_units_changed)
+
         # Check for API key
         global API_KEY
         API_KEY = load_api_key()
@@ -349,9 +464,6 @@ class UnitConverterApp:
         # Modify input binding
         self.input_entry.bind('<KeyRelease>', self._debounced_convert)
 
-        # Clear caches periodically
-        self._clear_caches()
-
         # Restore state
         self._restore_state()
 
@@ -359,6 +471,8 @@ class UnitConverterApp:
         self._loaded_categories = {}
 
     def _debounced_convert(self, event=None):
+        # Drop a running batch right away rather than after the debounce delay
+        self._cancel_stale_batch()
         if hasattr(self, '_convert_timer'):
             self.root.after_cancel(self._convert_timer)
         self._convert_timer = self.root.after(300, self.convert)
@@ -431,28 +545,51 @@ class UnitConverterApp:
         if rates is None:
             messagebox.showerror("Error", "Failed to fetch currency rates. Please check your internet connection.")
             return
-        conversion_data['currency'] = rates if rates else {}
-        self.status_bar.config(text="Currency rates updated successfully")
-        if self.unit_type_var.get() == 'currency':
-            self.update_unit_menus()
+        diff = diff_rates(conversion_data['currency'], rates)
+        if diff['added'] or diff['removed'] or diff['changed']:
+            conversion_data['currency'] = rates
+            self._publish_rate_changes(rates)
+            self.status_bar.config(
+                text=f"Currency rates updated: {len(diff['changed'])} changed, "
+                     f"{len(diff['added'])} added, {len(diff['removed'])} removed"
+            )
+        else:
+            self.status_bar.config(text="Currency rates unchanged")
         # Schedule next update after one hour
         self.root.after(3600000, self.update_currency_rates)
 
+    def subscribe_rate_changes(self, callback, threshold=0.0):
+        # callback(diff) runs on the Tk thread after each rate refresh. Each
+        # subscriber is diffed against the rates it was last told about, so
+        # changes below `threshold` (relative) still add up until reported.
+        self._rate_subscribers.append({
+            'callback': callback,
+            'threshold': threshold,
+            'baseline': dict(conversion_data['currency'])
+        })
+
+    def unsubscribe_rate_changes(self, callback):
+        self._rate_subscribers = [sub for sub in self._rate_subscribers if sub['callback'] != callback]
+
+    def _publish_rate_changes(self, rates):
+        for subscriber in list(self._rate_subscribers):
+            baseline = subscriber['baseline']
+            diff = filter_rate_diff(diff_rates(baseline, rates), subscriber['threshold'])
+            if not (diff['added'] or diff['removed'] or diff['changed']):
+                continue
+            # Only delivered codes move forward; the rest keep accumulating
+            for code in diff['removed']:
+                del baseline[code]
+            baseline.update(diff['added'])
+            for code, change in diff['changed'].items():
+                baseline[code] = change['new']
+            try:
+                subscriber['callback'](diff)
+            except Exception as e:
+                print(f"Error in rate change subscriber: {e}")
+
     def convert_temperature(self, value, from_unit, to_unit):
-        # First convert to Celsius
-        if from_unit == 'fahrenheit':
-            celsius = (value - 32) * 5/9
-        elif from_unit == 'kelvin':
-            celsius = value - 273.15
-        else:  # celsius
-            celsius = value
-
-        # Then convert to target unit
-        if to_unit == 'fahrenheit':
-            return (celsius * 9/5) + 32
-        elif to_unit == 'kelvin':
-            return celsius + 273.15
-        return celsius  # celsius to celsius
+        return convert_temperature(value, from_unit, to_unit)
 
     def setup_utc_converter(self):
         # UTC Converter UI
@@ -561,6 +698,13 @@ class UnitConverterApp:
     @validate_conversion
     def convert(self):
         try:
+            # Several values (e.g. a pasted spreadsheet column) go to a background job
+            if BATCH_SEPARATORS.search(self.input_entry.get().strip()):
+                self._start_batch_conversion()
+                return
+            self._cancel_batch_conversion()
+            self.batch_frame.grid_remove()
+
             # Generate cache key
             cache_key = (
                 self.unit_type_var.get(),
@@ -589,7 +733,7 @@ class UnitConverterApp:
 
             # Validate numeric input
             try:
-                input_value = float(input_text)
+                input_value = parse_input_value(input_text)
                 if input_value < 0 and unit_type not in ['temperature']:
                     self.result_label.config(text="Please enter a positive value", fg='red')
                     return
@@ -604,10 +748,7 @@ class UnitConverterApp:
                     self.result_label.config(text="Currency rates not available. Please refresh.", fg='red')
                     return
                 try:
-                    if conversion_data['currency'][from_unit] == 0:
-                        raise ValueError("Invalid exchange rate")
-                    usd_value = input_value / conversion_data['currency'][from_unit]
-                    result = usd_value * conversion_data['currency'][to_unit]
+                    result = convert_currency(input_value, from_unit, to_unit, conversion_data['currency'])
                     result_text = f"{input_value:.2f} {from_unit} = {result:.2f} {to_unit}"
                     self.result_label.config(text=result_text, fg='black')
                 except KeyError:
@@ -639,10 +780,163 @@ class UnitConverterApp:
         except Exception as e:
             self.result_label.config(text=f"Error: {str(e)}", fg='red')
 
-    def _clear_caches(self):
-        self.conversion_cache.clear()
-        self._menu_cache.clear()
-        self.root.after(3600000, self._clear_caches)  # Clear every hour
+    def _on_paste(self, event=None):
+        # Flatten pasted lines/cells so the single-line entry shows them readably
+        try:
+            text = self.root.clipboard_get()
+        except tk.TclError:
+            return 'break'
+        if self.input_entry.selection_present():
+            self.input_entry.delete('sel.first', 'sel.last')
+        self.input_entry.insert('insert', ' '.join(BATCH_SEPARATORS.split(text.strip())))
+        self._debounced_convert()
+        return 'break'
+
+    def _batch_key(self):
+        return (
+            self.unit_type_var.get(),
+            self.from_unit_var.get(),
+            self.to_unit_var.get(),
+            self.input_entry.get().strip()
+        )
+
+    def _on_batch_units_changed(self, *args):
+        # Unit changes don't trigger convert() on their own, so re-run the batch
+        # (running or finished) rather than leave results for the old units up
+        if self._batch_job_key is not None or self.batch_frame.winfo_manager():
+            self._batch_done_key = None
+            self._debounced_convert()
+            # Clear now so Copy Results can't pick up old numbers before the re-run
+            self.batch_text.config(state='normal')
+            self.batch_text.delete('1.0', 'end')
+            self.batch_text.config(state='disabled')
+            self.result_label.config(text="Converting values...", fg='black')
+
+    def _cancel_stale_batch(self):
+        if self._batch_job_key is not None and self._batch_job_key != self._batch_key():
+            self._cancel_batch_conversion()
+            self.status_bar.config(text="Conversion cancelled")
+
+    def _cancel_batch_conversion(self):
+        if self._batch_cancel_event:
+            self._batch_cancel_event.set()
+        # Bumping the id makes any chunks already queued by the worker be ignored
+        self._batch_job_id += 1
+        self._batch_job_key = None
+        self._batch_done_key = None
+        self._batch_cancel_event = None
+
+    def _start_batch_conversion(self):
+        key = self._batch_key()
+        if key == self._batch_job_key:
+            return  # Same job is already running
+        if key == self._batch_done_key:
+            return  # Nothing changed since the last run (e.g. arrow keys, Ctrl+C)
+        self._cancel_batch_conversion()
+
+        unit_type, from_unit, to_unit, input_text = key
+        conversions = conversion_data.get(unit_type, {})
+        if unit_type == 'currency' and not conversions:
+            self.batch_frame.grid_remove()
+            self.result_label.config(text="Currency rates not available. Please refresh.", fg='red')
+            return
+        if unit_type != 'temperature' and (from_unit not in conversions or to_unit not in conversions):
+            self.batch_frame.grid_remove()
+            self.result_label.config(text="Invalid units", fg='red')
+            return
+
+        job_id = self._batch_job_id
+        cancel_event = threading.Event()
+        self._batch_job_key = key
+        self._batch_cancel_event = cancel_event
+
+        self.batch_text.config(state='normal')
+        self.batch_text.delete('1.0', 'end')
+        self.batch_text.config(state='disabled')
+        self.batch_frame.grid()
+        self.result_label.config(text="Converting values...", fg='black')
+
+        thread = threading.Thread(
+            target=self._run_batch_conversion,
+            args=(job_id, cancel_event, input_text, unit_type, from_unit, to_unit, conversions),
+            daemon=True
+        )
+        thread.start()
+
+    def _run_batch_conversion(self, job_id, cancel_event, input_text, unit_type, from_unit, to_unit, conversions):
+        # Runs on a worker thread; results are handed back to Tk via root.after
+        tokens = [token for token in BATCH_SEPARATORS.split(input_text) if token]
+        total = len(tokens)
+        invalid = 0
+        precision = 2 if unit_type == 'currency' else 4
+        for start in range(0, max(total, 1), BATCH_CHUNK_SIZE):
+            if cancel_event.is_set():
+                return
+            lines = []
+            for token in tokens[start:start + BATCH_CHUNK_SIZE]:
+                try:
+                    value = parse_input_value(token)
+                    if value < 0 and unit_type != 'temperature':
+                        raise ValueError("Negative value")
+                    self.validate_input(value, unit_type)
+                    result = convert_value(value, unit_type, from_unit, to_unit, conversions)
+                    lines.append(f"{result:.{precision}f}")
+                except (ValueError, KeyError, ZeroDivisionError):
+                    invalid += 1
+                    lines.append("invalid")
+            done = min(start + BATCH_CHUNK_SIZE, total)
+            self.root.after(0, self._on_batch_chunk, job_id, lines, done, total, invalid)
+
+    def _on_batch_chunk(self, job_id, lines, done, total, invalid):
+        if job_id != self._batch_job_id:
+            return  # Stale chunk from a cancelled job
+        if lines:
+            self.batch_text.config(state='normal')
+            self.batch_text.insert('end', '\n'.join(lines) + ('\n' if done < total else ''))
+            self.batch_text.config(state='disabled')
+
+        if done < total:
+            self.status_bar.config(text=f"Converting... {done:,}/{total:,} values")
+            return
+
+        self._batch_done_key = self._batch_job_key
+        self._batch_job_key = None
+        self._batch_cancel_event = None
+        from_unit, to_unit = self.from_unit_var.get(), self.to_unit_var.get()
+        summary = f"Converted {total - invalid:,} values from {from_unit} to {to_unit}"
+        if invalid:
+            summary += f" ({invalid:,} invalid)"
+        self.result_label.config(text=summary, fg='red' if invalid == total else 'black')
+        self.status_bar.config(text=f"Batch conversion finished: {total:,} values")
+        self._save_state()
+
+    def _copy_batch_results(self):
+        self.root.clipboard_clear()
+        self.root.clipboard_append(self.batch_text.get('1.0', 'end-1c'))
+        self.status_bar.config(text="Results copied to clipboard")
+
+    def _invalidate_currency_caches(self, diff):
+        # Only drop cached results for pairs involving a changed currency
+        affected = affected_currencies(diff)
+        stale_keys = [key for key in self.conversion_cache
+                      if key[0] == 'currency' and (key[1] in affected or key[2] in affected)]
+        for key in stale_keys:
+            del self.conversion_cache[key]
+        if diff['added'] or diff['removed']:
+            self._menu_cache.pop('currency', None)
+
+    def _refresh_currency_view(self, diff):
+        if self.unit_type_var.get() != 'currency':
+            return
+        if diff['added'] or diff['removed']:
+            self.update_unit_menus()
+            return
+        # Re-run the visible conversion only if its pair moved
+        affected = affected_currencies(diff)
+        if ({self.from_unit_var.get(), self.to_unit_var.get()} & affected
+                and self.input_entry.get().strip()):
+            self._cancel_batch_conversion()
+            self.convert()
 
     def _save_state(self):
         try: